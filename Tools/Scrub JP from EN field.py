@@ -3,16 +3,24 @@ import re
 import sys
 import os
 
+# This regex pattern matches Japanese characters (Hiragana, Katakana, Kanji)
+# and common Japanese symbols, including a broader range of punctuation.
+# Compiled once here so the per-row checks don't go through re's pattern cache.
+JP_RE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF【】「」『』（）：―！、。・？]')
+
+# This regex matches strings that contain only punctuation or special characters
+PUNCT_RE = re.compile(r'[^\w\s]+')
+
 # Function to check if a string contains Japanese text or Japanese-style special characters
 def contains_japanese(text):
-    # This regex pattern matches Japanese characters (Hiragana, Katakana, Kanji)
-    # and common Japanese symbols, including a broader range of punctuation.
-    return bool(re.search(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF【】「」『』（）：―！、。・？]', text))
+    # Every character in JP_RE is non-ASCII, so plain English rows can skip the regex entirely
+    if text.isascii():
+        return False
+    return bool(JP_RE.search(text))
 
 # Function to check if a string contains only punctuation or special characters
 def contains_only_punctuation(text):
-    # This regex matches strings that contain only punctuation or special characters
-    return bool(re.fullmatch(r'[^\w\s]+', text))
+    return bool(PUNCT_RE.fullmatch(text))
 
 # Function to check if a string contains only numbers
 def contains_only_numbers(text):
@@ -45,6 +53,7 @@ for input_file in sys.argv[1:]:
 
         reader = csv.reader(infile)
         writer = csv.writer(outfile)
+        modified = False  # Tracks whether any entry was actually cleared
         
         # Iterate through each row
         for row in reader:
@@ -52,12 +61,19 @@ for input_file in sys.argv[1:]:
             if len(row) >= 4:
                 text = row[3].strip()  # Strip spaces and line breaks from both ends
                 # If the fourth column contains Japanese text, only punctuation, only numbers, or is empty/line break, clear the entire entry
-                if contains_japanese(text) or contains_only_punctuation(text) or contains_only_numbers(text) or is_empty_or_line_break(text):
+                if row[3] and (contains_japanese(text) or contains_only_punctuation(text) or contains_only_numbers(text) or is_empty_or_line_break(text)):
                     row[3] = ''  # Clear the entire string in the fourth column
+                    modified = True
             
             # Write the updated row to the temporary file
             writer.writerow(row)
 
+    # Leave the original file alone if nothing had to be cleared
+    if not modified:
+        os.remove(temp_file)
+        print(f"No changes needed for {input_file}")
+        continue
+
     # Replace the original file with the processed temporary file
     os.replace(temp_file, input_file)
 
@@ -12,12 +12,19 @@ def replace_backslashes_in_csv(file_path):
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
 
+        # Leave files without any backslashes untouched instead of rewriting them as-is
+        if '\\' not in content:
+            print(f"No backslashes found in {file_path}")
+            return
+
         # Replace all backslashes with forward slashes
         content = content.replace('\\', '/')
 
-        # Write the updated content back to the file
-        with open(file_path, 'w', encoding='utf-8') as file:
+        # Write to a temporary file first and swap it in, so a failed write can't leave a half-written CSV
+        temp_file = file_path + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
             file.write(content)
+        os.replace(temp_file, file_path)
 
         print(f"Successfully replaced backslashes in {file_path}")
 
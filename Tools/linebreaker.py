@@ -1,20 +1,22 @@
 import csv
 import os
+import re
 import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def wrap_regex(max_length):
+    # Greedily grabs as many whole words as fit in max_length characters;
+    # a single word that is longer than that is kept on its own line
+    return re.compile(r'\S(?:.{0,%d}\S)?(?= |$)|\S+' % (max_length - 2))
 
 def add_newlines(text, max_length=50):
     lines = []
+    wrap = wrap_regex(max_length).findall
     for line in text.split("\n"):
         if len(line) > max_length:
-            words = line.split()
-            new_line = ''
-            for word in words:
-                if len(new_line) + len(word) + 1 <= max_length:
-                    new_line += ' ' + word
-                else:
-                    lines.append(new_line.strip())
-                    new_line = word
-            lines.append(new_line.strip())
+            # Collapse runs of whitespace so the regex only has to deal with single spaces
+            lines.extend(wrap(' '.join(line.split())))
         else:
             lines.append(line.strip())
     return '\n'.join(lines)
@@ -30,14 +32,17 @@ def process_csv(input_file):
         with open(output_file, 'w', newline='', encoding="utf-8") as output_csv:
             writer = csv.writer(output_csv)
             writer.writerow(header)  # Write the processed header back
-            
+
+            # Bind the per-row calls to locals so the loop doesn't look them up every time
+            add = add_newlines
+            writerow = writer.writerow
             for row in reader:
-                row[3] = add_newlines(row[3])  # Target the fourth column
-                writer.writerow(row)
+                row[3] = add(row[3])  # Target the fourth column
+                writerow(row)
 
-# Check if a file is dragged onto the script
+# Check if files are dragged onto the script; process all of them in this one run
 if len(sys.argv) > 1:
-    input_file = sys.argv[1]
-    process_csv(input_file)
+    for input_file in sys.argv[1:]:
+        process_csv(input_file)
 else:
     print("Please drag and drop a CSV file onto the script.")
@@ -1,46 +1,44 @@
 # silly little tool for converting toml files to csv, by Feld (https://github.com/Feldherren)
 # if you have issues with it (this is far from perfect), just drop me a line. Or rewrite the thing yourself; I don't mind
 
-import toml # non-default; install with pip install toml
+try:
+    import tomllib # standard library from Python 3.11
+except ModuleNotFoundError:
+    import tomli as tomllib # non-default on older Pythons; install with pip install tomli
 import csv
 import glob
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-parser = argparse.ArgumentParser(prog='toml2yaml', description='Converts .toml files in specified location to .csv files')
-parser.add_argument('src', help='Source folder of .toml files')
-parser.add_argument('dst', help='Destination folder for .csv files')
-
-args = parser.parse_args()
-
-toml_files = glob.glob('**/*.toml', root_dir=args.src, recursive=True)
-
-for toml_file in toml_files:
+def convert_toml_file(toml_file, src, dst):
     # print(toml_file)
     # UTF-8-BOM is a blight that should not exist, but I don't want to have to change the encoding on 6000~ files so UTF-8-sig it is
-    f = open(os.path.join(args.src, toml_file), "r", encoding='UTF-8-sig')
+    # tomllib only takes binary files, so decode here and hand it the string instead
+    with open(os.path.join(src, toml_file), "r", encoding='UTF-8-sig') as f:
+        toml_text = f.read()
     try:
-        f_dict = toml.load(f)
-    except toml.decoder.TomlDecodeError:
+        f_dict = tomllib.loads(toml_text)
+    except tomllib.TOMLDecodeError:
         print(f'Error decoding {toml_file}; please handle it manually')
+        return
     # print(f_dict)
 
     # using pathlib.Path here lets us avoid needing to check if this folder exists first, or else get annoying errors
-    Path(os.path.join(args.dst, os.path.dirname(toml_file))).mkdir(parents=True, exist_ok=True)
+    Path(os.path.join(dst, os.path.dirname(toml_file))).mkdir(parents=True, exist_ok=True)
 
-    with open(os.path.join(args.dst, os.path.splitext(toml_file)[0] + '.csv'), 'w', newline='', encoding='UTF-8') as csvfile:
-        fieldnames = []
-        for header in f_dict:
-            for d in f_dict[header]:
-                print(d)
-                print(toml_file)
-                # note: this is allergic to 'default_format = {...}' as a first line, and will throw an exception, 
-                # but it'll also stop right after it reports the file so finding the thing and fixing it should be easy
-                # copes perfectly fine with format fields for items proper, though
-                for k in d.keys():
-                    if k not in fieldnames:
-                        fieldnames.append(k)
+    with open(os.path.join(dst, os.path.splitext(toml_file)[0] + '.csv'), 'w', newline='', encoding='UTF-8') as csvfile:
+        # note: this is allergic to 'default_format = {...}' as a first line, and will throw an exception,
+        # but it'll report the file before stopping so finding the thing and fixing it should be easy
+        # copes perfectly fine with format fields for items proper, though
+        # dict.fromkeys keeps the keys in first-seen order without a list search for every key
+        try:
+            fieldnames = list(dict.fromkeys(k for header in f_dict for d in f_dict[header] for k in d.keys()))
+        except AttributeError:
+            print(f'{toml_file} has something other than [[tables]] in it (default_format?); please handle it manually')
+            raise
 
         # fieldnames = ['key', 'old', 'new']
 
@@ -49,4 +47,19 @@ for toml_file in toml_files:
         writer.writeheader()
         for header in f_dict:
             for d in f_dict[header]:
-                writer.writerow(d)
\ No newline at end of file
+                writer.writerow(d)
+
+
+# each file gets converted independently, so spread them over all the CPU cores
+# the worker processes re-import this script, hence everything else living under __main__
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='toml2yaml', description='Converts .toml files in specified location to .csv files')
+    parser.add_argument('src', help='Source folder of .toml files')
+    parser.add_argument('dst', help='Destination folder for .csv files')
+
+    args = parser.parse_args()
+
+    toml_files = glob.glob('**/*.toml', root_dir=args.src, recursive=True)
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(partial(convert_toml_file, src=args.src, dst=args.dst), toml_files, chunksize=32))